@@ -11,14 +11,23 @@ from PySide6.QtCore import Qt
 class QuizDialog(QDialog):
     """Dialog for taking quizzes on QA and testing topics"""
 
-    def __init__(self, quiz_data, category, parent=None):
+    def __init__(self, quiz_data, category, parent=None, progress=None, translate=None):
         super().__init__(parent)
         self.quiz_data = quiz_data
+        # Maps English text to the selected language (identity by default)
+        self.translate = translate or (lambda text: text)
+        self.category = category
         self.current_question = 0
         self.score = 0
         self.user_answers = []
 
-        self.setWindowTitle(f"Quiz: {category}")
+        # Resume a quiz saved in a previous session at the next unanswered question
+        if progress:
+            self.restore_answers(progress.get("user_answers", []))
+
+        self.setWindowTitle(
+            self.translate("Quiz: {category}").format(category=self.translate(category))
+        )
         self.setMinimumSize(500, 400)
 
         self.setup_ui()
@@ -65,7 +74,7 @@ class QuizDialog(QDialog):
         button_layout = QHBoxLayout()
         button_layout.addStretch()
 
-        self.next_button = QPushButton("Next")
+        self.next_button = QPushButton(self.translate("Next"))
         self.next_button.setEnabled(False)
         self.next_button.clicked.connect(self.next_question)
         self.next_button.setStyleSheet(
@@ -92,6 +101,35 @@ class QuizDialog(QDialog):
 
         self.setLayout(layout)
 
+    def restore_answers(self, answers):
+        """Replay saved answers, stopping at the first one that is not a valid option"""
+        for question_data, answer in zip(self.quiz_data, answers):
+            valid = (
+                isinstance(answer, int)
+                and not isinstance(answer, bool)
+                and 0 <= answer < len(question_data["options"])
+            )
+            if not valid:
+                break
+            self.user_answers.append(answer)
+
+        # Never trust a saved score; derive it from the answers themselves
+        self.score = sum(
+            answer == question_data.get("correct")
+            for question_data, answer in zip(self.quiz_data, self.user_answers)
+        )
+        self.current_question = len(self.user_answers)
+
+    def is_finished(self):
+        return len(self.user_answers) >= len(self.quiz_data)
+
+    def progress(self):
+        """Answers given so far, in the form accepted by the constructor"""
+        return {
+            "category": self.category,
+            "user_answers": list(self.user_answers),
+        }
+
     def show_question(self):
         if not self.quiz_data or self.current_question >= len(self.quiz_data):
             self.show_results()
@@ -99,11 +137,14 @@ class QuizDialog(QDialog):
 
         question_data = self.quiz_data[self.current_question]
         self.question_label.setText(
-            f"Question {self.current_question + 1}: {question_data['question']}"
+            self.translate("Question {number}: {question}").format(
+                number=self.current_question + 1,
+                question=self.translate(question_data["question"]),
+            )
         )
 
         for i, option in enumerate(question_data["options"]):
-            self.option_buttons[i].setText(f"{chr(65 + i)}. {option}")
+            self.option_buttons[i].setText(f"{chr(65 + i)}. {self.translate(option)}")
             self.option_buttons[i].setStyleSheet(
                 """
                 QPushButton {
@@ -187,15 +228,17 @@ class QuizDialog(QDialog):
         self.show_question()
 
     def show_results(self):
-        result_text = f"You scored {self.score} out of {len(self.quiz_data)}."
+        result_text = self.translate("You scored {score} out of {total}.").format(
+            score=self.score, total=len(self.quiz_data)
+        )
         percentage = (self.score / len(self.quiz_data)) * 100
 
         if percentage >= 80:
-            result_text += "\nExcellent! You have a strong understanding of this topic."
+            result_text += "\n" + self.translate("Excellent! You have a strong understanding of this topic.")
         elif percentage >= 60:
-            result_text += "\nGood job! You have a decent grasp of the concepts."
+            result_text += "\n" + self.translate("Good job! You have a decent grasp of the concepts.")
         else:
-            result_text += "\nYou might want to review this topic again."
+            result_text += "\n" + self.translate("You might want to review this topic again.")
 
         for i, button in enumerate(self.option_buttons):
             button.setVisible(False)
@@ -204,6 +247,6 @@ class QuizDialog(QDialog):
         self.question_label.setAlignment(Qt.AlignCenter)
         self.question_label.setStyleSheet("font-size: 18px; margin: 20px;")
 
-        self.next_button.setText("Close")
+        self.next_button.setText(self.translate("Close"))
         self.next_button.clicked.disconnect()
         self.next_button.clicked.connect(self.accept)
@@ -0,0 +1,146 @@
+import re
+import time
+
+from PySide6.QtWidgets import QTextEdit
+from PySide6.QtCore import QTimer, Signal
+from PySide6.QtGui import QTextCursor, QTextDocument, QTextDocumentFragment, QTextFormat
+
+
+# Bullet ("-", "+", "*") or ordered ("1.", "1)") list item marker
+LIST_ITEM = re.compile(r"^ {0,3}([-+*]|\d+[.)])(\s|$)")
+
+
+def split_markdown_blocks(markdown):
+    """Split markdown into top-level blocks at blank lines that end a paragraph, list or fence"""
+    blocks = []
+    current = []
+    blank_lines = []
+    in_fence = False
+    in_list = False
+
+    for line in markdown.splitlines():
+        stripped = line.strip()
+
+        if not in_fence:
+            if not stripped:
+                # Keep blank lines until the next line shows whether the block ends
+                if current:
+                    blank_lines.append(line)
+                continue
+
+            is_list_item = bool(LIST_ITEM.match(line))
+            if blank_lines:
+                # Indented lines and further list items continue the block
+                continues = line[0] in " \t" or (in_list and is_list_item)
+                if continues:
+                    current.extend(blank_lines)
+                else:
+                    blocks.append("\n".join(current))
+                    current = []
+                    in_list = False
+                blank_lines = []
+
+            in_list = in_list or is_list_item
+
+        if stripped.startswith("```") or stripped.startswith("~~~"):
+            in_fence = not in_fence
+
+        current.append(line)
+
+    if current:
+        blocks.append("\n".join(current))
+    return blocks
+
+
+class ProgressiveMarkdownViewer(QTextEdit):
+    """Read-only markdown viewer that shows the first screenful at once and appends the rest in time slices"""
+
+    # Emitted once the whole document has been laid out
+    rendering_finished = Signal()
+
+    def __init__(self, parent=None, time_slice_ms=8):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self.time_slice_ms = time_slice_ms
+        self._pending = []
+
+        # Zero-interval timer runs one chunk per event loop iteration
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._render_chunk)
+
+    def set_markdown_progressive(self, markdown):
+        # Drop whatever is left of the previous document
+        self._timer.stop()
+        self.clear()
+
+        # Blocks are popped from the end, so keep them reversed
+        self._pending = split_markdown_blocks(markdown)
+        self._pending.reverse()
+
+        # Fill the visible area synchronously so text appears immediately
+        viewport_height = self.viewport().height()
+        self._append_until(lambda: self._document_height() >= viewport_height)
+
+        if self._pending:
+            self._timer.start()
+        else:
+            self.rendering_finished.emit()
+
+    def is_rendering(self):
+        return bool(self._pending)
+
+    def _document_height(self):
+        return self.document().documentLayout().documentSize().height()
+
+    def _render_chunk(self):
+        deadline = time.perf_counter() + self.time_slice_ms / 1000
+        self._append_until(lambda: time.perf_counter() >= deadline)
+
+        if not self._pending:
+            self._timer.stop()
+            self.rendering_finished.emit()
+
+    def _append_until(self, done):
+        while self._pending:
+            self._append_block(self._pending.pop())
+            if done():
+                break
+
+    def _append_block(self, block):
+        # Parse the chunk on its own with the same importer setMarkdown uses
+        chunk = QTextDocument()
+        chunk.setMarkdown(block)
+        first = chunk.begin()
+
+        # insertFragment merges the chunk's first block into the block at the
+        # cursor, so that block must already carry the heading/quote/code
+        # format; list membership is restored by the fragment itself
+        block_format = first.blockFormat()
+        block_format.clearProperty(QTextFormat.ObjectIndex)
+
+        # A chunk that opens with a table starts with the empty block Qt keeps
+        # in front of every table; let it merge into the previous block
+        second = first.next()
+        starts_with_table = (
+            not first.text()
+            and second.isValid()
+            and QTextCursor(second).currentTable() is not None
+        )
+
+        # A leading list item already gets a block of its own from insertFragment
+        starts_own_block = starts_with_table or (
+            first.textList() is not None and not self.document().isEmpty()
+        )
+
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.End)
+        if not starts_own_block:
+            if self.document().isEmpty():
+                cursor.setBlockFormat(block_format)
+                cursor.setBlockCharFormat(first.charFormat())
+            else:
+                cursor.insertBlock(block_format, first.charFormat())
+
+        cursor.insertFragment(QTextDocumentFragment(chunk))
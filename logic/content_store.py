@@ -0,0 +1,110 @@
+import time
+import zlib
+from collections import Counter, OrderedDict
+from collections.abc import Mapping
+
+
+def train_dictionary(bodies, max_size=32768, min_words=2, max_words=8):
+    """Build a zlib preset dictionary from phrases shared between topic bodies"""
+    # Count in how many bodies each word n-gram appears
+    document_frequency = Counter()
+    for body in bodies:
+        words = body.split()
+        phrases = set()
+        for n in range(min_words, max_words + 1):
+            for i in range(len(words) - n + 1):
+                phrases.add(" ".join(words[i : i + n]))
+        document_frequency.update(phrases)
+
+    # Longer phrases repeated across more bodies save the most bytes
+    candidates = [
+        (len(phrase) * (count - 1), phrase)
+        for phrase, count in document_frequency.items()
+        if count > 1
+    ]
+    candidates.sort(reverse=True)
+
+    chosen = []
+    size = 0
+    for _, phrase in candidates:
+        if any(phrase in existing for existing in chosen):
+            continue
+        encoded_size = len(phrase.encode("utf-8")) + 1
+        if size + encoded_size > max_size:
+            break
+        chosen.append(phrase)
+        size += encoded_size
+
+    # zlib matches closest to the end of the dictionary are cheapest,
+    # so the most valuable phrases go last
+    chosen.reverse()
+    return " ".join(chosen).encode("utf-8")
+
+
+class CompressedContentStore(Mapping):
+    """Read-only topic -> body mapping that keeps bodies zlib-compressed with a shared dictionary"""
+
+    def __init__(self, content, cache_size=8, level=9, max_dictionary_size=32768):
+        self.dictionary = train_dictionary(content.values(), max_dictionary_size)
+        self.cache_size = cache_size
+        self._blobs = {}
+        self._raw_size = 0
+        self._cache = OrderedDict()
+        self._latencies = {}
+
+        for topic, body in content.items():
+            raw = body.encode("utf-8")
+            compressor = self._compressor(level)
+            self._blobs[topic] = compressor.compress(raw) + compressor.flush()
+            self._raw_size += len(raw)
+
+    def _compressor(self, level):
+        if self.dictionary:
+            return zlib.compressobj(level, zdict=self.dictionary)
+        return zlib.compressobj(level)
+
+    def _decompressor(self):
+        if self.dictionary:
+            return zlib.decompressobj(zdict=self.dictionary)
+        return zlib.decompressobj()
+
+    def __getitem__(self, topic):
+        if topic in self._cache:
+            self._cache.move_to_end(topic)
+            return self._cache[topic]
+
+        blob = self._blobs[topic]
+        start = time.perf_counter()
+        decompressor = self._decompressor()
+        body = (decompressor.decompress(blob) + decompressor.flush()).decode("utf-8")
+        elapsed = time.perf_counter() - start
+
+        calls, total = self._latencies.get(topic, (0, 0.0))
+        self._latencies[topic] = (calls + 1, total + elapsed)
+
+        self._cache[topic] = body
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return body
+
+    def __iter__(self):
+        return iter(self._blobs)
+
+    def __len__(self):
+        return len(self._blobs)
+
+    def compressed_size(self):
+        """Bytes held for all bodies, including the shared dictionary"""
+        return sum(len(blob) for blob in self._blobs.values()) + len(self.dictionary)
+
+    def compression_ratio(self):
+        """Uncompressed UTF-8 size divided by compressed size (higher is better)"""
+        compressed = self.compressed_size()
+        return self._raw_size / compressed if compressed else 1.0
+
+    def decompression_stats(self):
+        """Per-topic decompression count and mean latency in milliseconds"""
+        return {
+            topic: {"calls": calls, "mean_ms": total * 1000 / calls}
+            for topic, (calls, total) in self._latencies.items()
+        }
@@ -0,0 +1,156 @@
+import os
+
+from logic.session_state import DEFAULT_SESSION_PATH
+
+# Learned transitions and prefetch statistics, kept next to the session snapshot
+DEFAULT_NAVIGATION_PATH = os.path.join(
+    os.path.dirname(DEFAULT_SESSION_PATH), "navigation.json"
+)
+
+# Once a state's outgoing counts reach this total they are halved, so the
+# model keeps adapting to how the learner navigates now
+MAX_TRANSITION_TOTAL = 200
+
+# Prefetch outcomes: used when shown, not prefetched in time, discarded unused
+STAT_NAMES = ("hits", "misses", "wasted")
+
+
+def topic_state(topic):
+    return f"topic:{topic}"
+
+
+def quiz_state(category):
+    return f"quiz:{category}"
+
+
+class NavigationModel:
+    """First-order Markov model of transitions between topics and quizzes"""
+
+    def __init__(self, transitions=None):
+        # state -> {next state: count}
+        self.transitions = transitions or {}
+        self.current = None
+
+    def record(self, state):
+        if self.current is not None and state != self.current:
+            counts = self.transitions.setdefault(self.current, {})
+            counts[state] = counts.get(state, 0) + 1
+
+            if sum(counts.values()) > MAX_TRANSITION_TOTAL:
+                self.transitions[self.current] = {
+                    next_state: count // 2
+                    for next_state, count in counts.items()
+                    if count // 2
+                }
+        self.current = state
+
+    def predict(self, state, limit=2, min_probability=0.2):
+        """Most likely next states after `state`, best first"""
+        counts = self.transitions.get(state, {})
+        total = sum(counts.values())
+        ranked = sorted(counts.items(), key=lambda item: item[1], reverse=True)
+        return [
+            next_state
+            for next_state, count in ranked[:limit]
+            if count / total >= min_probability
+        ]
+
+
+class NavigationPrefetcher:
+    """Loads the data for the predicted next steps ahead of time and tracks how often that pays off"""
+
+    def __init__(self, model, loader, limit=2):
+        self.model = model
+        # Called with a state, returns the data needed to show it
+        self.loader = loader
+        self.limit = limit
+        self._prefetched = {}
+        # Counters for this session only
+        self.hits = 0
+        self.misses = 0
+        self.wasted = 0
+        self._lifetime = dict.fromkeys(STAT_NAMES, 0)
+
+    def take(self, state):
+        """Return prefetched data for `state`, or None if it has to be loaded now"""
+        # Re-showing the current step (e.g. after a language switch) is not navigation
+        if state == self.model.current:
+            return None
+
+        data = self._prefetched.pop(state, None)
+        if data is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return data
+
+    def visit(self, state):
+        """Record navigation to `state` and drop prefetched data that is no longer predicted"""
+        self.model.record(state)
+
+        predicted = set(self.model.predict(state, self.limit))
+        for stale in set(self._prefetched) - predicted:
+            del self._prefetched[stale]
+            self.wasted += 1
+
+    def prefetch(self):
+        """Load the predicted next steps; meant to run while the UI is idle"""
+        for state in self.model.predict(self.model.current, self.limit):
+            if state not in self._prefetched:
+                self._prefetched[state] = self.loader(state)
+
+    def clear(self):
+        self.wasted += len(self._prefetched)
+        self._prefetched.clear()
+
+    def stats(self):
+        """Hit-rate statistics for this session and across all saved sessions"""
+        session = _rate({"hits": self.hits, "misses": self.misses, "wasted": self.wasted})
+        lifetime = _rate(
+            {name: self._lifetime[name] + session[name] for name in STAT_NAMES}
+        )
+        return {"session": session, "lifetime": lifetime}
+
+    def to_dict(self):
+        stats = self.stats()
+        return {
+            "transitions": self.model.transitions,
+            "stats": {name: stats["lifetime"][name] for name in STAT_NAMES},
+            "last_session": stats["session"],
+        }
+
+    @classmethod
+    def from_dict(cls, data, loader, limit=2):
+        """Rebuild a prefetcher from saved data, dropping anything malformed"""
+        transitions = {}
+        saved_transitions = data.get("transitions")
+        if isinstance(saved_transitions, dict):
+            for state, counts in saved_transitions.items():
+                if not isinstance(counts, dict):
+                    continue
+                valid = {
+                    next_state: count
+                    for next_state, count in counts.items()
+                    if _is_count(count) and count > 0
+                }
+                if valid:
+                    transitions[state] = valid
+
+        prefetcher = cls(NavigationModel(transitions), loader, limit)
+
+        # Counters saved by earlier sessions; this session's are kept apart
+        stats = data.get("stats")
+        if isinstance(stats, dict):
+            for name in STAT_NAMES:
+                if _is_count(stats.get(name)):
+                    prefetcher._lifetime[name] = stats[name]
+        return prefetcher
+
+
+def _is_count(value):
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
+def _rate(counts):
+    lookups = counts["hits"] + counts["misses"]
+    return dict(counts, hit_rate=counts["hits"] / lookups if lookups else 0.0)
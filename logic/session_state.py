@@ -0,0 +1,33 @@
+import json
+import os
+import tempfile
+
+# Per-user location of the UI/quiz snapshot restored on the next launch
+DEFAULT_SESSION_PATH = os.path.join(
+    os.path.expanduser("~"), ".qa_testing_app", "session.json"
+)
+
+
+def load_session(path=DEFAULT_SESSION_PATH):
+    """Return the saved session snapshot, or an empty dict if there is none"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return snapshot if isinstance(snapshot, dict) else {}
+
+
+def save_session(snapshot, path=DEFAULT_SESSION_PATH):
+    """Write the session snapshot atomically so a crash never leaves a partial file"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".session-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
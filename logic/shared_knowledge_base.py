@@ -0,0 +1,231 @@
+import argparse
+import json
+import mmap
+import os
+import signal
+import struct
+import time
+from collections.abc import Mapping
+from multiprocessing import shared_memory
+
+# Segment name used when neither the loader nor the app is given one
+DEFAULT_SEGMENT_NAME = "qa_testing_kb"
+
+# Seats usually run as their own users, so by default anyone may read the
+# (non-secret) content; the loader's --mode can narrow this, e.g. to 0o440
+DEFAULT_SEGMENT_MODE = 0o444
+
+# Segment layout (little-endian):
+#   header: magic, length of the JSON index
+#   index:  categories, quizzes and {topic: [offset, length]} into the body area
+#   bodies: UTF-8 topic content, read in place by every attached process
+SEGMENT_MAGIC = b"QAKBSHM1"
+_HEADER = struct.Struct("<8sI")
+
+
+def publish(knowledge_base, name=DEFAULT_SEGMENT_NAME, mode=DEFAULT_SEGMENT_MODE):
+    """Copy a knowledge base into a new shared-memory segment and return the segment"""
+    bodies = bytearray()
+    offsets = {}
+    for topic, body in knowledge_base.content.items():
+        encoded = body.encode("utf-8")
+        offsets[topic] = [len(bodies), len(encoded)]
+        bodies += encoded
+
+    index = json.dumps(
+        {
+            "categories": knowledge_base.categories,
+            "quizzes": knowledge_base.quizzes,
+            "content": offsets,
+        }
+    ).encode("utf-8")
+
+    payload = _HEADER.pack(SEGMENT_MAGIC, len(index)) + index + bodies
+    segment = shared_memory.SharedMemory(name=name, create=True, size=len(payload))
+    segment.buf[: len(payload)] = payload
+
+    # SharedMemory creates the segment as 0600; the loader's mapping stays writable
+    if os.name == "posix":
+        os.fchmod(segment._fd, mode)
+    return segment
+
+
+class _ReadOnlySegment:
+    """Read-only mapping of an existing POSIX shared-memory segment"""
+
+    def __init__(self, name):
+        import _posixshmem
+
+        # SharedMemory always attaches read-write, which a read-only segment refuses
+        fd = _posixshmem.shm_open("/" + name, os.O_RDONLY, mode=0)
+        try:
+            self._map = mmap.mmap(fd, os.fstat(fd).st_size, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        self.buf = memoryview(self._map)
+
+    def close(self):
+        self.buf.release()
+        self._map.close()
+
+
+def _attach(name):
+    if os.name == "posix":
+        # Never registered with the resource tracker, so one seat exiting
+        # cannot unlink the segment for the others
+        return _ReadOnlySegment(name)
+    return shared_memory.SharedMemory(name=name)
+
+
+def _unlink(name):
+    if os.name == "posix":
+        import _posixshmem
+
+        # Unlink by name: opening a read-only segment read-write would fail
+        _posixshmem.shm_unlink("/" + name)
+    else:
+        # Windows frees named mappings once the last handle closes
+        shared_memory.SharedMemory(name=name).close()
+
+
+class SharedContent(Mapping):
+    """Read-only topic -> body mapping decoded straight out of the shared segment"""
+
+    def __init__(self, buffer, offsets):
+        self._buffer = buffer
+        self._offsets = offsets
+
+    def __getitem__(self, topic):
+        offset, length = self._offsets[topic]
+        return str(self._buffer[offset : offset + length], "utf-8")
+
+    def __iter__(self):
+        return iter(self._offsets)
+
+    def __len__(self):
+        return len(self._offsets)
+
+
+class SharedKnowledgeBase:
+    """Knowledge base attached read-only to a segment published by the loader process"""
+
+    def __init__(self, name=DEFAULT_SEGMENT_NAME):
+        self.content = None
+        self._segment = _attach(name)
+        self._view = self._segment.buf.toreadonly()
+
+        try:
+            categories, quizzes, offsets, index_end = self._read_index()
+        except ValueError:
+            self.close()
+            raise ValueError(f"Shared memory segment '{name}' does not hold a knowledge base")
+
+        self.categories = categories
+        self.quizzes = quizzes
+        self.content = SharedContent(self._view[index_end:], offsets)
+
+    def _read_index(self):
+        if len(self._view) < _HEADER.size:
+            raise ValueError("segment is shorter than the header")
+        magic, index_length = _HEADER.unpack_from(self._view, 0)
+        index_end = _HEADER.size + index_length
+        if magic != SEGMENT_MAGIC or index_end > len(self._view):
+            raise ValueError("bad header")
+
+        index = json.loads(str(self._view[_HEADER.size : index_end], "utf-8"))
+        if not isinstance(index, dict):
+            raise ValueError("index is not an object")
+        categories = index.get("categories")
+        quizzes = index.get("quizzes")
+        offsets = index.get("content")
+        if not all(isinstance(part, dict) for part in (categories, quizzes, offsets)):
+            raise ValueError("index is missing categories, quizzes or content")
+
+        # Every body must lie inside the segment
+        body_size = len(self._view) - index_end
+        for span in offsets.values():
+            valid = (
+                isinstance(span, list)
+                and len(span) == 2
+                and all(isinstance(n, int) and n >= 0 for n in span)
+                and span[0] + span[1] <= body_size
+            )
+            if not valid:
+                raise ValueError("content offsets out of range")
+        return categories, quizzes, offsets, index_end
+
+    def get_categories(self):
+        return list(self.categories.keys())
+
+    def get_topics(self, category):
+        return self.categories.get(category, [])
+
+    def get_content(self, topic):
+        return self.content.get(topic, "Content for this topic is not available.")
+
+    def get_quiz(self, category):
+        return self.quizzes.get(category, [])
+
+    def close(self):
+        """Detach from the segment; must run before exit or SharedMemory.__del__ fails"""
+        if self._segment is None:
+            return
+
+        # Views must be released before the segment can be unmapped
+        if self.content is not None:
+            self.content._buffer.release()
+        self._view.release()
+        self._segment.close()
+        self._segment = None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Publish the QA knowledge base into shared memory for other app instances"
+    )
+    parser.add_argument("--name", default=DEFAULT_SEGMENT_NAME, help="shared memory segment name")
+    parser.add_argument(
+        "--replace",
+        action="store_true",
+        help="remove an existing segment with the same name (e.g. left by a crashed loader)",
+    )
+    parser.add_argument(
+        "--mode",
+        type=lambda value: int(value, 8),
+        default=DEFAULT_SEGMENT_MODE,
+        help="octal permissions for the segment (default: %(default)o, readable by all seats)",
+    )
+    args = parser.parse_args()
+
+    from gui.qa import QAKnowledgeBase
+
+    if args.replace:
+        try:
+            _unlink(args.name)
+        except FileNotFoundError:
+            pass
+
+    try:
+        segment = publish(QAKnowledgeBase(), args.name, args.mode)
+    except FileExistsError:
+        parser.exit(
+            1,
+            f"Shared memory segment '{args.name}' already exists. If no other loader is "
+            "running it was left by a crash; rerun with --replace to remove it.\n",
+        )
+    print(f"Published knowledge base to '{args.name}' ({segment.size} bytes). Press Ctrl+C to stop.")
+
+    # Treat SIGTERM like Ctrl+C so the segment is always unlinked
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        segment.close()
+        segment.unlink()
+
+
+if __name__ == "__main__":
+    main()
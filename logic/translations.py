@@ -0,0 +1,181 @@
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+
+from logic.session_state import DEFAULT_SESSION_PATH
+
+# Language the knowledge base and UI strings are written in
+SOURCE_LOCALE = "en"
+
+# Source catalogs (<locale>.json) and their compiled form (<locale>.qcat)
+DEFAULT_LOCALE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "locales"
+)
+
+# Per-user directory for catalogs compiled at runtime; the install itself
+# may be read-only and is shared by every instance on a multi-seat host
+DEFAULT_CATALOG_CACHE_DIR = os.path.join(
+    os.path.dirname(DEFAULT_SESSION_PATH), "catalogs"
+)
+
+# Display names for the language selector; unknown locales show their code
+LANGUAGE_NAMES = {
+    "en": "English",
+    "tr": "Türkçe",
+}
+
+# Compiled catalog layout (little-endian):
+#   header: magic, entry count
+#   index:  one (key offset, key length, value offset, value length) per entry,
+#           sorted by UTF-8 key bytes so lookups can binary search the map
+#   data:   UTF-8 keys and values
+CATALOG_MAGIC = b"QACAT001"
+_HEADER = struct.Struct("<8sI")
+_ENTRY = struct.Struct("<4I")
+
+
+def compile_catalog(source_path, catalog_path):
+    """Compile a JSON {english: translation} catalog into the memory-mappable format"""
+    with open(source_path, encoding="utf-8") as f:
+        messages = json.load(f)
+
+    entries = sorted(
+        (key.encode("utf-8"), value.encode("utf-8"))
+        for key, value in messages.items()
+        if value
+    )
+
+    data_offset = _HEADER.size + _ENTRY.size * len(entries)
+    index = bytearray()
+    data = bytearray()
+    for key, value in entries:
+        key_offset = data_offset + len(data)
+        data += key
+        value_offset = data_offset + len(data)
+        data += value
+        index += _ENTRY.pack(key_offset, len(key), value_offset, len(value))
+
+    # Write to a unique temp file so concurrent compilers never interleave
+    directory = os.path.dirname(catalog_path)
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".catalog-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(CATALOG_MAGIC, len(entries)))
+            f.write(index)
+            f.write(data)
+        os.replace(temp_path, catalog_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+class Catalog:
+    """Read-only view of a compiled catalog; pages are only touched when looked up"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # A truncated file cannot even hold the header
+        if len(self._map) < _HEADER.size:
+            self._map.close()
+            raise ValueError(f"{path} is not a compiled translation catalog")
+
+        magic, self._count = _HEADER.unpack_from(self._map, 0)
+        if magic != CATALOG_MAGIC or len(self._map) < _HEADER.size + self._count * _ENTRY.size:
+            self._map.close()
+            raise ValueError(f"{path} is not a compiled translation catalog")
+
+    def _entry(self, i):
+        return _ENTRY.unpack_from(self._map, _HEADER.size + i * _ENTRY.size)
+
+    def lookup(self, text):
+        key = text.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            key_offset, key_length, value_offset, value_length = self._entry(middle)
+            candidate = self._map[key_offset : key_offset + key_length]
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                return self._map[value_offset : value_offset + value_length].decode("utf-8")
+        return None
+
+    def close(self):
+        self._map.close()
+
+
+class Translator:
+    """Translates English strings using the catalog of the selected locale, loaded on demand"""
+
+    def __init__(self, locale_dir=DEFAULT_LOCALE_DIR, cache_dir=DEFAULT_CATALOG_CACHE_DIR):
+        self.locale_dir = locale_dir
+        self.cache_dir = cache_dir
+        self.locale = SOURCE_LOCALE
+        self._catalog = None
+
+    def available_locales(self):
+        locales = {SOURCE_LOCALE}
+        if os.path.isdir(self.locale_dir):
+            for name in os.listdir(self.locale_dir):
+                base, ext = os.path.splitext(name)
+                if ext in (".json", ".qcat"):
+                    locales.add(base)
+        return [SOURCE_LOCALE] + sorted(locales - {SOURCE_LOCALE})
+
+    def catalog_path(self, locale):
+        source_path = os.path.join(self.locale_dir, f"{locale}.json")
+        shipped_path = os.path.join(self.locale_dir, f"{locale}.qcat")
+        cached_path = os.path.join(self.cache_dir, f"{locale}.qcat")
+
+        if not os.path.exists(source_path):
+            return shipped_path
+
+        # Use the catalog shipped with the app unless its source was edited since
+        source_mtime = os.path.getmtime(source_path)
+        if os.path.exists(shipped_path) and os.path.getmtime(shipped_path) >= source_mtime:
+            return shipped_path
+
+        # Otherwise compile into the per-user cache when missing or outdated
+        if not os.path.exists(cached_path) or os.path.getmtime(cached_path) < source_mtime:
+            compile_catalog(source_path, cached_path)
+        return cached_path
+
+    def set_locale(self, locale):
+        if locale == self.locale:
+            return
+
+        catalog = None
+        if locale != SOURCE_LOCALE:
+            catalog = Catalog(self.catalog_path(locale))
+
+        # Unmap the previous locale so only one catalog is ever resident
+        if self._catalog is not None:
+            self._catalog.close()
+        self._catalog = catalog
+        self.locale = locale
+
+    def gettext(self, text):
+        if self._catalog is None:
+            return text
+        translation = self._catalog.lookup(text)
+        return text if translation is None else translation
+
+
+if __name__ == "__main__":
+    # Compile every source catalog: python -m logic.translations [locale_dir]
+    locale_dir = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_LOCALE_DIR
+    for name in sorted(os.listdir(locale_dir)):
+        base, ext = os.path.splitext(name)
+        if ext == ".json":
+            compile_catalog(
+                os.path.join(locale_dir, name), os.path.join(locale_dir, f"{base}.qcat")
+            )
+            print(f"Compiled {base}")
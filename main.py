@@ -1,5 +1,6 @@
 # ─────────────────────────────────────────────
 # 📦 Standard Library Imports
+import os  # Environment variables (shared knowledge base segment)
 import sys  # System-specific parameters and functions
 import random  # Random number generation (used in quizzes, etc.)
 import json  # Handling JSON data structures (quiz data, content, etc.)
@@ -23,12 +24,13 @@ from PySide6.QtWidgets import (
     QMessageBox,  # Message popup dialogs
 )
 
-from PySide6.QtCore import Qt, Signal, Slot, QSize, QObject
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QObject, QTimer
 
 # Qt: Contains core enums like AlignCenter, etc.
 # Signal/Slot: Event communication mechanism
 # QSize: Defines dimensions
 # QObject: Base class for all Qt objects
+# QTimer: Deferred and periodic callbacks (session restore/autosave)
 
 from PySide6.QtGui import QFont, QIcon
 
@@ -37,8 +39,46 @@ from PySide6.QtGui import QFont, QIcon
 
 # ─────────────────────────────────────────────
 # 📂 Internal Project Imports
-from gui.qa import QAKnowledgeBase  # Knowledge base interface for QA topics
 from gui.quiz import QuizDialog  # Quiz dialog interface
+from gui.topic_viewer import ProgressiveMarkdownViewer  # Chunked markdown viewer
+from logic.session_state import load_session, save_session  # Session snapshot I/O
+from logic.translations import LANGUAGE_NAMES, SOURCE_LOCALE, Translator  # Localization
+from logic.navigation import (  # Next-step prediction and prefetching
+    DEFAULT_NAVIGATION_PATH,
+    NavigationPrefetcher,
+    quiz_state,
+    topic_state,
+)
+
+from logic.shared_knowledge_base import SharedKnowledgeBase  # Multi-seat shared content
+
+# How often the UI/quiz state snapshot is written while the app is running
+SESSION_AUTOSAVE_INTERVAL_MS = 30_000
+
+# Names a shared-memory segment published by `python -m logic.shared_knowledge_base`
+SHARED_KB_ENV = "QA_SHARED_KB"
+
+# Set to 1 to keep topic bodies compressed in memory (decompressed on demand)
+COMPRESSED_CONTENT_ENV = "QA_COMPRESSED_CONTENT"
+
+
+def load_knowledge_base():
+    """Attach to the shared knowledge base if one is configured, else build a private copy"""
+    segment_name = os.environ.get(SHARED_KB_ENV)
+    if segment_name:
+        try:
+            return SharedKnowledgeBase(segment_name)
+        except (OSError, ValueError) as error:
+            print(
+                f"Shared knowledge base '{segment_name}' unavailable ({error}); "
+                "loading a private copy",
+                file=sys.stderr,
+            )
+
+    # Imported only when needed so attached seats never load their own copy
+    from gui.qa import QAKnowledgeBase  # Knowledge base interface for QA topics
+
+    return QAKnowledgeBase(compressed=os.environ.get(COMPRESSED_CONTENT_ENV) == "1")
 
 
 class MainWindow(QWidget):
@@ -46,9 +86,34 @@ class MainWindow(QWidget):
 
     def __init__(self):
         super().__init__()
-        self.knowledge_base = QAKnowledgeBase()
+        self.knowledge_base = load_knowledge_base()
+
+        # Detach from a shared knowledge base once the event loop has stopped
+        if isinstance(self.knowledge_base, SharedKnowledgeBase):
+            QApplication.instance().aboutToQuit.connect(self.knowledge_base.close)
+        self.session = load_session()
+        self.translator = Translator()
+        self.restore_locale()
+        self.current_topic = None
+        self.active_quiz = None
+        self._pending_scroll = None
+
+        # Learned navigation habits decide what to load before it is clicked
+        self.prefetcher = NavigationPrefetcher.from_dict(
+            load_session(DEFAULT_NAVIGATION_PATH), self.load_state_data
+        )
         self.setup_ui()
 
+        # Periodically persist the session so a crash loses little progress
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.setInterval(SESSION_AUTOSAVE_INTERVAL_MS)
+        self.autosave_timer.timeout.connect(self.save_session_snapshot)
+        self.autosave_timer.start()
+
+        # Restore the previous session once the window is on screen
+        if self.session:
+            QTimer.singleShot(0, self.restore_session)
+
     def setup_ui(self):
         # Set the window title and minimum size
         self.setWindowTitle("QA & Testing Education App")
@@ -83,22 +148,20 @@ class MainWindow(QWidget):
         main_layout = QVBoxLayout()
 
         # Header title
-        header = QLabel("QA & Testing Education App")
-        header.setAlignment(Qt.AlignCenter)
-        header.setStyleSheet(
+        self.header = QLabel()
+        self.header.setAlignment(Qt.AlignCenter)
+        self.header.setStyleSheet(
             "font-size: 24px; font-weight: bold; color: #2c3e50; margin: 10px;"
         )
-        main_layout.addWidget(header)
+        main_layout.addWidget(self.header)
 
         # Short description below the header
-        description = QLabel(
-            "Learn about software testing concepts, methodologies, and best practices based on ISTQB syllabus"
-        )
-        description.setAlignment(Qt.AlignCenter)
-        description.setStyleSheet(
+        self.description = QLabel()
+        self.description.setAlignment(Qt.AlignCenter)
+        self.description.setStyleSheet(
             "font-size: 14px; color: #7f8c8d; margin-bottom: 20px;"
         )
-        main_layout.addWidget(description)
+        main_layout.addWidget(self.description)
 
         # Horizontal layout for sidebar + main content area
         content_layout = QHBoxLayout()
@@ -107,21 +170,45 @@ class MainWindow(QWidget):
         sidebar = QVBoxLayout()
         sidebar.setContentsMargins(0, 0, 10, 0)
 
+        # Language label
+        self.language_label = QLabel()
+        self.language_label.setStyleSheet("font-weight: bold;")
+        sidebar.addWidget(self.language_label)
+
+        # Language selector; a locale's catalog is only loaded once it is picked
+        self.language_combo = QComboBox()
+        for locale in self.translator.available_locales():
+            self.language_combo.addItem(LANGUAGE_NAMES.get(locale, locale), locale)
+        self.language_combo.setCurrentIndex(
+            self.language_combo.findData(self.translator.locale)
+        )
+        self.language_combo.currentIndexChanged.connect(self.language_changed)
+        sidebar.addWidget(self.language_combo)
+
         # Category label
-        category_label = QLabel("Categories:")
-        category_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
-        sidebar.addWidget(category_label)
+        self.category_label = QLabel()
+        self.category_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        sidebar.addWidget(self.category_label)
 
-        # Category dropdown selector
+        # Category dropdown selector (item data holds the untranslated name)
         self.category_combo = QComboBox()
-        self.category_combo.addItems(self.knowledge_base.get_categories())
+        for category in self.knowledge_base.get_categories():
+            self.category_combo.addItem(category, category)
+
+        # Start on the category from the previous session, if it still exists
+        saved_category = self.session.get("category")
+        if saved_category in self.knowledge_base.get_categories():
+            self.category_combo.setCurrentIndex(
+                self.category_combo.findData(saved_category)
+            )
+
         self.category_combo.currentIndexChanged.connect(self.category_changed)
         sidebar.addWidget(self.category_combo)
 
         # Topic label
-        topic_label = QLabel("Topics:")
-        topic_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
-        sidebar.addWidget(topic_label)
+        self.topic_label = QLabel()
+        self.topic_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        sidebar.addWidget(self.topic_label)
 
         # Topics container frame with custom style
         topics_frame = QFrame()
@@ -131,9 +218,10 @@ class MainWindow(QWidget):
 
         # Create topic buttons dynamically based on selected category
         self.topics_buttons = []
-        initial_category = self.category_combo.currentText()
+        initial_category = self.category_combo.currentData()
         for topic in self.knowledge_base.get_topics(initial_category):
-            button = QPushButton(topic)
+            button = QPushButton(self.translate(topic))
+            button.setProperty("topic", topic)
             button.setStyleSheet(
                 """
                 QPushButton {
@@ -161,7 +249,7 @@ class MainWindow(QWidget):
         sidebar.addWidget(topics_frame)
 
         # Quiz button at the bottom of sidebar
-        self.quiz_button = QPushButton("Take Quiz on Current Category")
+        self.quiz_button = QPushButton()
         self.quiz_button.setStyleSheet(
             """
             QPushButton {
@@ -196,15 +284,14 @@ class MainWindow(QWidget):
         content_inner_layout = QVBoxLayout(content_frame)
 
         # Title of selected topic
-        self.content_title = QLabel("Select a topic to begin")
+        self.content_title = QLabel()
         self.content_title.setStyleSheet(
             "font-size: 18px; font-weight: bold; color: #2c3e50; margin-bottom: 10px;"
         )
         content_inner_layout.addWidget(self.content_title)
 
-        # Text area for displaying topic content
-        self.content_text = QTextEdit()
-        self.content_text.setReadOnly(True)
+        # Read-only viewer that renders long topics progressively
+        self.content_text = ProgressiveMarkdownViewer()
         self.content_text.setStyleSheet("font-size: 14px; line-height: 1.5;")
         content_inner_layout.addWidget(self.content_text)
 
@@ -215,20 +302,151 @@ class MainWindow(QWidget):
         main_layout.addLayout(content_layout)
 
         # Footer label at the bottom
-        footer = QLabel("Created with PySide6 - QA & Testing Knowledge Base")
-        footer.setAlignment(Qt.AlignCenter)
-        footer.setStyleSheet("color: #95a5a6; margin: 10px;")
-        main_layout.addWidget(footer)
+        self.footer = QLabel()
+        self.footer.setAlignment(Qt.AlignCenter)
+        self.footer.setStyleSheet("color: #95a5a6; margin: 10px;")
+        main_layout.addWidget(self.footer)
 
         # Set the final layout to the window
         self.setLayout(main_layout)
 
-        # Automatically click the first topic button (if any)
-        if self.topics_buttons:
+        # Fill in all static texts in the selected language
+        self.retranslate_ui()
+
+        # Automatically click the first topic button (if any), unless
+        # restore_session is about to show the saved topic instead
+        if self.topics_buttons and not self.has_restorable_topic():
             self.topics_buttons[0].click()
 
+        # Keep the saved scroll position until the restored topic is fully laid out
+        self.content_text.rendering_finished.connect(self.apply_pending_scroll)
+
+    def translate(self, text):
+        return self.translator.gettext(text)
+
+    def restore_locale(self):
+        locale = self.session.get("locale", SOURCE_LOCALE)
+        if locale in self.translator.available_locales():
+            try:
+                self.translator.set_locale(locale)
+            except (OSError, ValueError):
+                # Missing or corrupt catalog: stay on the source language
+                pass
+
+    def language_changed(self):
+        locale = self.language_combo.currentData()
+        try:
+            self.translator.set_locale(locale)
+        except (OSError, ValueError):
+            QMessageBox.warning(
+                self,
+                self.translate("Language Unavailable"),
+                self.translate(
+                    "The translation catalog for '{locale}' could not be loaded."
+                ).format(locale=LANGUAGE_NAMES.get(locale, locale)),
+            )
+            self.language_combo.blockSignals(True)
+            self.language_combo.setCurrentIndex(
+                self.language_combo.findData(self.translator.locale)
+            )
+            self.language_combo.blockSignals(False)
+            return
+
+        # Prefetched content is in the previous language
+        self.prefetcher.clear()
+        self.retranslate_ui()
+
+    def retranslate_ui(self):
+        """Update the texts of existing widgets in place for the current language"""
+        self.setWindowTitle(self.translate("QA & Testing Education App"))
+        self.header.setText(self.translate("QA & Testing Education App"))
+        self.description.setText(
+            self.translate(
+                "Learn about software testing concepts, methodologies, and best practices based on ISTQB syllabus"
+            )
+        )
+        self.language_label.setText(self.translate("Language:"))
+        self.category_label.setText(self.translate("Categories:"))
+        self.topic_label.setText(self.translate("Topics:"))
+        self.quiz_button.setText(self.translate("Take Quiz on Current Category"))
+        self.footer.setText(
+            self.translate("Created with PySide6 - QA & Testing Knowledge Base")
+        )
+
+        for i in range(self.category_combo.count()):
+            self.category_combo.setItemText(
+                i, self.translate(self.category_combo.itemData(i))
+            )
+        for button in self.topics_buttons:
+            button.setText(self.translate(button.property("topic")))
+
+        # Re-render the open topic, keeping the reader's place
+        if self.current_topic is None:
+            self.content_title.setText(self.translate("Select a topic to begin"))
+        else:
+            scroll = self.content_text.verticalScrollBar().value()
+            self.show_topic_content(self.current_topic)
+            self.restore_scroll(scroll)
+
+    def has_restorable_topic(self):
+        category = self.category_combo.currentData()
+        return self.session.get("topic") in self.knowledge_base.get_topics(category)
+
+    def restore_session(self):
+        topic = self.session.get("topic")
+        if self.has_restorable_topic():
+            for button in self.topics_buttons:
+                if button.property("topic") == topic:
+                    button.setChecked(True)
+                    self.show_topic_content(topic)
+                    break
+
+        scroll = self.session.get("scroll")
+        if topic == self.current_topic and isinstance(scroll, int):
+            self.restore_scroll(scroll)
+
+        quiz = self.session.get("quiz")
+        if isinstance(quiz, dict) and quiz.get("category") in self.knowledge_base.get_categories():
+            self.open_quiz(quiz["category"], quiz)
+
+    def restore_scroll(self, scroll):
+        # Long topics are still being laid out, so wait for the full height
+        if self.content_text.is_rendering():
+            self._pending_scroll = scroll
+        else:
+            self.content_text.verticalScrollBar().setValue(scroll)
+
+    def apply_pending_scroll(self):
+        if self._pending_scroll is not None:
+            self.content_text.verticalScrollBar().setValue(self._pending_scroll)
+            self._pending_scroll = None
+
+    def session_snapshot(self):
+        snapshot = {
+            "locale": self.translator.locale,
+            "category": self.category_combo.currentData(),
+            "topic": self.current_topic,
+            "scroll": self.content_text.verticalScrollBar().value(),
+        }
+        if self.active_quiz is not None and not self.active_quiz.is_finished():
+            snapshot["quiz"] = self.active_quiz.progress()
+        return snapshot
+
+    def save_session_snapshot(self):
+        try:
+            save_session(self.session_snapshot())
+            save_session(self.prefetcher.to_dict(), DEFAULT_NAVIGATION_PATH)
+        except OSError:
+            # A read-only home directory should not break the app
+            pass
+
+    def closeEvent(self, event):
+        self.save_session_snapshot()
+        self.log_prefetch_stats()
+        super().closeEvent(event)
+
     def category_changed(self):
-        category = self.category_combo.currentText()
+        category = self.category_combo.currentData()
         topics = self.knowledge_base.get_topics(category)
 
         # Clear current topic buttons
@@ -241,7 +459,8 @@ class MainWindow(QWidget):
         # Add new topic buttons
         topics_layout = self.findChild(QFrame).layout()
         for topic in topics:
-            button = QPushButton(topic)
+            button = QPushButton(self.translate(topic))
+            button.setProperty("topic", topic)
             button.setStyleSheet(
                 """
                 QPushButton {
@@ -271,27 +490,67 @@ class MainWindow(QWidget):
     def show_topic_content(self, topic):
         # Uncheck all other buttons
         for button in self.topics_buttons:
-            if button.text() != topic:
+            if button.property("topic") != topic:
                 button.setChecked(False)
 
-        content = self.knowledge_base.get_content(topic)
-        self.content_title.setText(topic)
-        self.content_text.setMarkdown(content)
+        # A newly selected topic starts at the top
+        self._pending_scroll = None
+        self.current_topic = topic
+
+        state = topic_state(topic)
+        content = self.prefetcher.take(state)
+        if content is None:
+            content = self.load_state_data(state)
+
+        self.content_title.setText(self.translate(topic))
+        self.content_text.set_markdown_progressive(content)
+
+        # Learn from this step and warm up the likely next ones when idle
+        self.prefetcher.visit(state)
+        QTimer.singleShot(0, self.prefetcher.prefetch)
+
+    def log_prefetch_stats(self):
+        stats = self.prefetcher.stats()
+        session, lifetime = stats["session"], stats["lifetime"]
+        print(
+            f"Prefetch hit rate: {session['hit_rate']:.0%} this session "
+            f"({session['hits']} hits, {session['misses']} misses, {session['wasted']} unused), "
+            f"{lifetime['hit_rate']:.0%} overall",
+            file=sys.stderr,
+        )
+
+    def load_state_data(self, state):
+        kind, _, name = state.partition(":")
+        if kind == "quiz":
+            return self.knowledge_base.get_quiz(name)
+        return self.translate(self.knowledge_base.get_content(name))
 
     def start_quiz(self):
-        category = self.category_combo.currentText()
-        quiz_data = self.knowledge_base.get_quiz(category)
+        self.open_quiz(self.category_combo.currentData())
+
+    def open_quiz(self, category, progress=None):
+        state = quiz_state(category)
+        quiz_data = self.prefetcher.take(state)
+        if quiz_data is None:
+            quiz_data = self.load_state_data(state)
 
         if not quiz_data:
             QMessageBox.information(
                 self,
-                "No Quiz Available",
-                f"No quiz questions available for the '{category}' category yet.",
+                self.translate("No Quiz Available"),
+                self.translate(
+                    "No quiz questions available for the '{category}' category yet."
+                ).format(category=self.translate(category)),
             )
             return
 
-        quiz_dialog = QuizDialog(quiz_data, category, self)
-        quiz_dialog.exec_()
+        self.prefetcher.visit(state)
+        QTimer.singleShot(0, self.prefetcher.prefetch)
+        self.active_quiz = QuizDialog(
+            quiz_data, category, self, progress, self.translate
+        )
+        self.active_quiz.exec_()
+        self.active_quiz = None
 
 
 if __name__ == "__main__":